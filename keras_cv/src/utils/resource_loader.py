@@ -17,35 +17,52 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import functools
 import os
+import threading
 import warnings
 
 import tensorflow as tf
 
 TF_VERSION_FOR_ABI_COMPATIBILITY = "2.13"
-abi_warning_already_raised = False
+_ABI_COMPATIBLE = tf.__version__.startswith(TF_VERSION_FOR_ABI_COMPATIBILITY)
+
+# Ops modules keyed by absolute library path, shared by all `LazySO`
+# instances so that each shared object is only loaded once per process.
+_LOADED_OPS = {}
+_LOAD_LOCK = threading.Lock()
+# Tracked separately from `_LOADED_OPS` so that the ABI warning is shown once
+# per process even when `tf.load_op_library` keeps failing.
+_abi_warning_raised = False
+
+# The project root is fixed for the lifetime of the process, so resolve it
+# once at import time rather than on every lookup.
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 def get_project_root():
     """Returns project root folder."""
-    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return _PROJECT_ROOT
 
 
+@functools.lru_cache(maxsize=None)
 def get_path_to_datafile(path):
     """Get the path to the specified file in the data dependencies.
 
-    The path is relative to keras_cv/
+    The path is relative to keras_cv/. Results are cached for the lifetime
+    of the process; call `get_path_to_datafile.cache_clear()` to reset.
 
     Args:
       path: a string resource path relative to keras_cv/
     Returns:
       The path to the specified data file
     """
-    root_dir = get_project_root()
-    return os.path.join(root_dir, path.replace("/", os.sep))
+    return os.path.join(_PROJECT_ROOT, path.replace("/", os.sep))
 
 
 class LazySO:
+    __slots__ = ("relative_path", "_ops")
+
     def __init__(self, relative_path):
         self.relative_path = relative_path
         self._ops = None
@@ -53,15 +70,25 @@ class LazySO:
     @property
     def ops(self):
         if self._ops is None:
-            self.display_warning_if_incompatible()
-            self._ops = tf.load_op_library(
-                get_path_to_datafile(self.relative_path)
-            )
+            # The lock is deliberately held across `tf.load_op_library` so
+            # that concurrent first accesses wait for a single load instead of
+            # each loading the library themselves.
+            with _LOAD_LOCK:
+                # Re-check under the lock: another thread may have finished
+                # loading while we were waiting.
+                if self._ops is None:
+                    path = get_path_to_datafile(self.relative_path)
+                    ops = _LOADED_OPS.get(path)
+                    if ops is None:
+                        self.display_warning_if_incompatible()
+                        ops = tf.load_op_library(path)
+                        _LOADED_OPS[path] = ops
+                    self._ops = ops
         return self._ops
 
     def display_warning_if_incompatible(self):
-        global abi_warning_already_raised
-        if abi_warning_already_raised or abi_is_compatible():
+        global _abi_warning_raised
+        if _abi_warning_raised or _ABI_COMPATIBLE:
             return
 
         user_version = tf.__version__
@@ -77,8 +104,8 @@ class LazySO:
             "This is a known limitation.",
             UserWarning,
         )
-        abi_warning_already_raised = True
+        _abi_warning_raised = True
 
 
 def abi_is_compatible():
-    return tf.__version__.startswith(TF_VERSION_FOR_ABI_COMPATIBILITY)
+    return _ABI_COMPATIBLE
@@ -0,0 +1,157 @@
+# Copyright 2024 The KerasCV Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import unittest.mock
+import warnings
+
+import tensorflow as tf
+
+from keras_cv.src.tests.test_case import TestCase
+from keras_cv.src.utils import resource_loader
+
+CUSTOM_OPS_PATH = "custom_ops/_keras_cv_custom_ops.so"
+
+
+class LazySOTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        resource_loader._LOADED_OPS.clear()
+        resource_loader._abi_warning_raised = False
+
+    def tearDown(self):
+        resource_loader._LOADED_OPS.clear()
+        resource_loader._abi_warning_raised = False
+        super().tearDown()
+
+    def test_incompatible_abi_warns_once(self):
+        with unittest.mock.patch.object(
+            resource_loader, "_ABI_COMPATIBLE", False
+        ), unittest.mock.patch.object(
+            tf, "load_op_library", return_value=object()
+        ), warnings.catch_warnings(
+            record=True
+        ) as caught:
+            warnings.simplefilter("always")
+            resource_loader.LazySO(CUSTOM_OPS_PATH).ops
+            resource_loader.LazySO(CUSTOM_OPS_PATH).ops
+
+        abi_warnings = [
+            w
+            for w in caught
+            if "trying to load a KerasCV custom op" in str(w.message)
+        ]
+        self.assertEqual(len(abi_warnings), 1)
+        self.assertIs(abi_warnings[0].category, UserWarning)
+
+    def test_incompatible_abi_warns_once_when_load_fails(self):
+        lazy_so = resource_loader.LazySO(CUSTOM_OPS_PATH)
+        load_error = tf.errors.NotFoundError(None, None, "undefined symbol")
+        with unittest.mock.patch.object(
+            resource_loader, "_ABI_COMPATIBLE", False
+        ), unittest.mock.patch.object(
+            tf, "load_op_library", side_effect=load_error
+        ), warnings.catch_warnings(
+            record=True
+        ) as caught:
+            warnings.simplefilter("always")
+            for _ in range(2):
+                with self.assertRaises(tf.errors.NotFoundError):
+                    lazy_so.ops
+
+        abi_warnings = [
+            w
+            for w in caught
+            if "trying to load a KerasCV custom op" in str(w.message)
+        ]
+        self.assertEqual(len(abi_warnings), 1)
+
+    def test_same_library_is_loaded_once(self):
+        with unittest.mock.patch.object(
+            resource_loader, "_ABI_COMPATIBLE", True
+        ), unittest.mock.patch.object(
+            tf, "load_op_library", return_value=object()
+        ) as load_op_library:
+            first = resource_loader.LazySO(CUSTOM_OPS_PATH)
+            second = resource_loader.LazySO(CUSTOM_OPS_PATH)
+            first_ops = first.ops
+            second_ops = second.ops
+
+        load_op_library.assert_called_once_with(
+            resource_loader.get_path_to_datafile(CUSTOM_OPS_PATH)
+        )
+        self.assertIs(first_ops, second_ops)
+
+    def test_concurrent_access_loads_once(self):
+        num_threads = 8
+        release = threading.Event()
+        lock = _CountingLock()
+        ops = object()
+
+        def slow_load_op_library(path):
+            release.wait(timeout=10)
+            return ops
+
+        lazy_so = resource_loader.LazySO(CUSTOM_OPS_PATH)
+        results = []
+        with unittest.mock.patch.object(
+            resource_loader, "_ABI_COMPATIBLE", True
+        ), unittest.mock.patch.object(
+            resource_loader, "_LOAD_LOCK", lock
+        ), unittest.mock.patch.object(
+            tf, "load_op_library", side_effect=slow_load_op_library
+        ) as load_op_library:
+            threads = [
+                threading.Thread(target=lambda: results.append(lazy_so.ops))
+                for _ in range(num_threads)
+            ]
+            for thread in threads:
+                thread.start()
+            try:
+                # Keep the first load blocked until every thread has passed
+                # the unlocked `_ops is None` check and reached the lock.
+                self.assertTrue(lock.wait_for_entries(num_threads, timeout=10))
+            finally:
+                release.set()
+                for thread in threads:
+                    thread.join(timeout=10)
+
+        load_op_library.assert_called_once()
+        self.assertEqual(len(results), num_threads)
+        for result in results:
+            self.assertIs(result, ops)
+
+
+class _CountingLock:
+    """Lock that counts how many threads have tried to acquire it."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._entries = 0
+
+    def __enter__(self):
+        with self._condition:
+            self._entries += 1
+            self._condition.notify_all()
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self._lock.release()
+
+    def wait_for_entries(self, count, timeout):
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._entries >= count, timeout=timeout
+            )
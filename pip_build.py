@@ -17,16 +17,17 @@ python3 pip_build.py --install
 
 import argparse
 import datetime
-import glob
 import os
 import pathlib
 import re
 import shutil
+import subprocess
 
 package = "keras_cv"
 build_directory = "tmp_build_dir"
 dist_directory = "dist"
 to_copy = ["setup.py", "setup.cfg", "README.md"]
+version_regex = re.compile("\n__version__ = .*\n")
 
 
 def ignore_files(_, filenames):
@@ -35,26 +36,28 @@ def ignore_files(_, filenames):
 
 def export_version_string(version, is_nightly=False):
     """Export Version and Package Name."""
-    if is_nightly:
-        date = datetime.datetime.now()
-        version += f".dev{date.strftime('%Y%m%d%H')}"
-        # Replaces `name="keras-cv"` in `setup.py` with `keras-cv-nightly`
-        with open("setup.py") as f:
-            setup_contents = f.read()
-        with open("setup.py", "w") as f:
-            setup_contents = setup_contents.replace(
-                'name="keras-cv"', 'name="keras-cv-nightly"'
-            )
-            f.write(setup_contents)
+    if not is_nightly:
+        # `version` was read from `version_utils.py`, so there is nothing to
+        # rewrite for a regular release.
+        return
+
+    date = datetime.datetime.now()
+    version += f".dev{date.strftime('%Y%m%d%H')}"
+    # Replaces `name="keras-cv"` in `setup.py` with `keras-cv-nightly`
+    with open("setup.py") as f:
+        setup_contents = f.read()
+    with open("setup.py", "w") as f:
+        setup_contents = setup_contents.replace(
+            'name="keras-cv"', 'name="keras-cv-nightly"'
+        )
+        f.write(setup_contents)
 
     # Make sure to export the __version__ string
     with open(os.path.join(package, "src", "version_utils.py")) as f:
         init_contents = f.read()
     with open(os.path.join(package, "src", "version_utils.py"), "w") as f:
-        init_contents = re.sub(
-            "\n__version__ = .*\n",
-            f'\n__version__ = "{version}"\n',
-            init_contents,
+        init_contents = version_regex.sub(
+            f'\n__version__ = "{version}"\n', init_contents
         )
         f.write(init_contents)
 
@@ -90,21 +93,29 @@ def build(root_path, is_nightly=False):
 
 
 def build_and_save_output(root_path, __version__):
-    # Build the package
-    os.system("python3 -m build")
+    # Build the package. stdout/stderr are inherited so the build log streams
+    # straight to the terminal without going through a shell or a pipe.
+    subprocess.run(["python3", "-m", "build"])
 
     # Save the dist files generated by the build process
     os.chdir(root_path)
     if not os.path.exists(dist_directory):
         os.mkdir(dist_directory)
-    for fpath in glob.glob(
-        os.path.join(build_directory, dist_directory, "*.*")
-    ):
-        shutil.copy(fpath, dist_directory)
-
-    # Find the .whl file path
+    # Pick out the .whl file while copying, instead of listing `dist/` again
     whl_path = None
-    for fname in os.listdir(dist_directory):
+    entries = []
+    build_dist_directory = os.path.join(build_directory, dist_directory)
+    if os.path.isdir(build_dist_directory):
+        with os.scandir(build_dist_directory) as it:
+            entries = [e for e in it if e.is_file() and "." in e.name]
+    for entry in entries:
+        fname = entry.name
+        # The build directory is scratch, so rename the outputs into place
+        # rather than copying their bytes.
+        try:
+            os.replace(entry.path, os.path.join(dist_directory, fname))
+        except OSError:
+            shutil.copy(entry.path, dist_directory)
         if __version__ in fname and fname.endswith(".whl"):
             whl_path = os.path.abspath(os.path.join(dist_directory, fname))
     if whl_path:
@@ -116,7 +127,9 @@ def build_and_save_output(root_path, __version__):
 
 def install_whl(whl_fpath):
     print(f"Installing wheel file: {whl_fpath}")
-    os.system(f"pip3 install {whl_fpath} --force-reinstall --no-dependencies")
+    subprocess.run(
+        ["pip3", "install", whl_fpath, "--force-reinstall", "--no-dependencies"]
+    )
 
 
 if __name__ == "__main__":
@@ -132,7 +145,7 @@ if __name__ == "__main__":
         help="Whether to generate nightly wheel file.",
     )
     args = parser.parse_args()
-    root_path = pathlib.Path(__file__).parent.resolve()
+    root_path = pathlib.Path(os.path.abspath(__file__)).parent
     whl_path = build(root_path, args.nightly)
     if whl_path and args.install:
         install_whl(whl_path)